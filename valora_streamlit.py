@@ -9,18 +9,20 @@ st.title("🏡 Valora: AI Real Estate Investment Advisor")
 
 # --- SIDEBAR INPUTS ---
 st.sidebar.header("Property Inputs")
-address = st.sidebar.text_input("Property Address", "879 Reflection Cove Rd E, Jacksonville, FL")
-asking_price = st.sidebar.number_input("Asking Price ($)", min_value=50000, max_value=5000000, value=300000, step=5000)
-beds = st.sidebar.number_input("Beds", min_value=0, max_value=20, value=3)
-baths = st.sidebar.number_input("Baths", min_value=0, max_value=20, value=2)
-sqft = st.sidebar.number_input("Square Feet", min_value=100, max_value=20000, value=1800)
-condition = st.sidebar.selectbox("Condition", ["Poor", "Fair", "Good", "Excellent"])
-occupancy = st.sidebar.selectbox("Occupancy", ["Vacant", "Tenant Occupied", "Owner Occupied"])
-seller_motivation = st.sidebar.text_input("Seller Motivation (if known)")
+with st.sidebar.form("inputs"):
+    address = st.text_input("Property Address", "879 Reflection Cove Rd E, Jacksonville, FL")
+    asking_price = st.number_input("Asking Price ($)", min_value=50000, max_value=5000000, value=300000, step=5000)
+    beds = st.number_input("Beds", min_value=0, max_value=20, value=3)
+    baths = st.number_input("Baths", min_value=0, max_value=20, value=2)
+    sqft = st.number_input("Square Feet", min_value=100, max_value=20000, value=1800)
+    condition = st.selectbox("Condition", ["Poor", "Fair", "Good", "Excellent"])
+    occupancy = st.selectbox("Occupancy", ["Vacant", "Tenant Occupied", "Owner Occupied"])
+    seller_motivation = st.text_input("Seller Motivation (if known)")
 
-repair = st.sidebar.number_input("Estimated Repair Cost ($)", min_value=0, max_value=500000, value=20000, step=1000)
-years = st.sidebar.slider("Holding Period (Years)", 1, 10, 5)
-strategy = st.sidebar.selectbox("Investment Strategy", ["Buy & Hold", "Fix & Flip", "Rental"])
+    repair = st.number_input("Estimated Repair Cost ($)", min_value=0, max_value=500000, value=20000, step=1000)
+    years = st.slider("Holding Period (Years)", 1, 10, 5)
+    strategy = st.selectbox("Investment Strategy", ["Buy & Hold", "Fix & Flip", "Rental"])
+    st.form_submit_button("Analyze")
 
 # --- DATA CALCULATIONS ---
 # Appreciation assumptions
@@ -28,15 +30,20 @@ appreciation_rate = 0.035  # 3.5% yearly
 future_value = asking_price * (1 + appreciation_rate) ** years
 
 # ROI calculations
+total_cost = asking_price + repair
+rent = asking_price * 0.008  # approx 0.8% monthly rent
+expenses = asking_price * 0.01  # yearly expenses 1%
+cash_flow = (rent*12 - expenses) * years
+roi_flip = (future_value - total_cost) / total_cost
+roi_hold = (future_value - asking_price) / asking_price
+roi_rental = (future_value + cash_flow - total_cost) / total_cost
+
 if strategy == "Fix & Flip":
-    roi = (future_value - (asking_price + repair)) / (asking_price + repair)
+    roi = roi_flip
 elif strategy == "Rental":
-    rent = asking_price * 0.008  # approx 0.8% monthly rent
-    expenses = asking_price * 0.01  # yearly expenses 1%
-    cash_flow = (rent*12 - expenses) * years
-    roi = (future_value + cash_flow - (asking_price + repair)) / (asking_price + repair)
+    roi = roi_rental
 else:  # Buy & Hold
-    roi = (future_value - asking_price) / asking_price
+    roi = roi_hold
 
 # --- DASHBOARD METRICS ---
 st.subheader(f"📍 {address}")
@@ -58,19 +65,15 @@ st.write(f"- Seller Motivation: {seller_motivation}")
 
 # --- GRAPHS ---
 st.subheader("📈 Property Value Over Time")
-years_list = list(range(1, years+1))
-value_list = [asking_price * (1 + appreciation_rate) ** y for y in years_list]
+years_list = np.arange(1, years+1)
+value_list = asking_price * np.power(1 + appreciation_rate, years_list)
 fig1 = px.line(x=years_list, y=value_list, labels={'x':'Year', 'y':'Value ($)'}, title="Projected Property Value")
 st.plotly_chart(fig1, use_container_width=True)
 
 if strategy == "Fix & Flip":
     roi_compare = pd.DataFrame({
         "Strategy": ["Fix & Flip", "Buy & Hold", "Rental"],
-        "ROI": [
-            (future_value - (asking_price + repair)) / (asking_price + repair),
-            (future_value - asking_price)/asking_price,
-            ((future_value + (asking_price*0.008*12*years) - (asking_price + repair)) / (asking_price + repair))
-        ]
+        "ROI": [roi_flip, roi_hold, roi_rental]
     })
     st.subheader("📊 ROI Comparison by Strategy")
     fig2 = px.bar(roi_compare, x="Strategy", y="ROI", text="ROI", labels={"ROI":"ROI (%)"})